@@ -7,13 +7,13 @@ makes the snake switch between moving head-first and tail-first!
 
 Author: Created with Windsurf AI
 Version: 1.0
-Requires: pygame>=2.1.0
+Requires: pygame>=2.1.0, numpy
 """
 
 import pygame
 import random
 import sys
-import math
+import numpy as np
 
 # Initialize Pygame
 pygame.init()
@@ -24,6 +24,8 @@ WINDOW_HEIGHT = 600
 CELL_SIZE = 20
 GRID_WIDTH = WINDOW_WIDTH // CELL_SIZE
 GRID_HEIGHT = WINDOW_HEIGHT // CELL_SIZE
+TICK_MS = 100  # 10 FPS for classic snake feel
+ALL_CELLS = frozenset((x, y) for x in range(GRID_WIDTH) for y in range(GRID_HEIGHT))
 
 # Colors - Retro Palette
 BLACK = (0, 0, 0)
@@ -37,6 +39,14 @@ CYAN = (0, 255, 255)
 DARK_GREEN = (0, 128, 0)
 DARK_GRAY = (64, 64, 64)
 
+# Arrow keys mapped to grid directions
+DIRECTION_KEYS = {
+    pygame.K_UP: (0, -1),
+    pygame.K_DOWN: (0, 1),
+    pygame.K_LEFT: (-1, 0),
+    pygame.K_RIGHT: (1, 0),
+}
+
 class Snake:
     """Snake class handling movement, growth, and direction switching mechanics."""
     
@@ -45,24 +55,61 @@ class Snake:
         # Start with a small snake in the center
         center_x = GRID_WIDTH // 2
         center_y = GRID_HEIGHT // 2
-        self.body = [(center_x, center_y), (center_x - 1, center_y), (center_x - 2, center_y)]
+        # Body is a ring buffer of (x, y) cells, large enough that it can never wrap onto itself.
+        # The head advances by self.step and the tail follows in the same direction.
+        self.capacity = GRID_WIDTH * GRID_HEIGHT + 1
+        self.body = np.empty((self.capacity, 2), dtype=np.int16)
+        self.body[:3] = [(center_x - 2, center_y), (center_x - 1, center_y), (center_x, center_y)]
+        self.tail_idx = 0
+        self.head_idx = 2
+        self.length = 3
+        self.step = 1
+        self.body_set = set(self.segments())  # Occupied cells for O(1) collision checks
+        self.collided = False
         self.direction = (1, 0)  # Moving right initially
         self.grow_next = False
         self.moving_backwards = False  # Flag for permanent direction switch
+    
+    @property
+    def head(self):
+        """Grid position of the moving end of the snake."""
+        return tuple(self.body[self.head_idx].tolist())
+    
+    @property
+    def tail(self):
+        """Grid position of the trailing end of the snake."""
+        return tuple(self.body[self.tail_idx].tolist())
+    
+    def segments(self):
+        """List body segments from head to tail as (x, y) tuples."""
+        indices = (self.head_idx - self.step * np.arange(self.length)) % self.capacity
+        return list(map(tuple, self.body[indices].tolist()))
         
     def move(self):
         """Move the snake one step in the current direction."""
-        # Always move the head (index 0) in the current direction
+        body = self.body
+        body_set = self.body_set
+        step = self.step
+        capacity = self.capacity
+        
+        # Always move the head in the current direction
         # The body orientation is handled by the eat_food method
-        head_x, head_y = self.body[0]
+        head_x, head_y = body[self.head_idx].tolist()
         dir_x, dir_y = self.direction
         new_head = (head_x + dir_x, head_y + dir_y)
         
-        self.body.insert(0, new_head)
+        # Vacate the tail first so moving into the cell it leaves is allowed
         if not self.grow_next:
-            self.body.pop()
+            body_set.discard(tuple(body[self.tail_idx].tolist()))
+            self.tail_idx = (self.tail_idx + step) % capacity
         else:
             self.grow_next = False
+            self.length += 1
+        
+        self.collided = new_head in body_set
+        self.head_idx = (self.head_idx + step) % capacity
+        body[self.head_idx] = new_head
+        body_set.add(new_head)
     
     def change_direction(self, new_direction):
         """Change snake direction, preventing 180-degree turns."""
@@ -73,19 +120,16 @@ class Snake:
     
     def check_collision(self):
         """Check if snake has collided with walls or itself."""
-        # Always check collision for head (index 0) since that's always the moving part
-        head = self.body[0]
+        # Always check collision for head since that's always the moving part
+        head = self.head
         
         # Check wall collision
         if (head[0] < 0 or head[0] >= GRID_WIDTH or 
             head[1] < 0 or head[1] >= GRID_HEIGHT):
             return True
         
-        # Check self collision
-        if head in self.body[1:]:
-            return True
-        
-        return False
+        # Self collision is detected by move() via the occupied-cell set
+        return self.collided
     
     def eat_food(self, food_number):
         """Handle eating food: switch direction and grow snake.
@@ -96,9 +140,10 @@ class Snake:
         # Switch movement direction permanently
         self.moving_backwards = not self.moving_backwards
         
-        # When switching direction, reverse the body list so head becomes tail
+        # When switching direction, swap the head and tail ends so head becomes tail
         # This creates the visual effect of the snake "flipping around"
-        self.body.reverse()
+        self.head_idx, self.tail_idx = self.tail_idx, self.head_idx
+        self.step = -self.step
         # Also reverse the direction vector
         self.direction = (-self.direction[0], -self.direction[1])
         
@@ -115,20 +160,26 @@ class Food:
     
     def generate_position(self):
         """Generate a random position on the game grid."""
-        x = random.randint(0, GRID_WIDTH - 1)
-        y = random.randint(0, GRID_HEIGHT - 1)
+        x = random.randrange(GRID_WIDTH)
+        y = random.randrange(GRID_HEIGHT)
         return (x, y)
     
-    def respawn(self, snake_body):
+    def respawn(self, snake_body_set):
         """Respawn food in a position not occupied by the snake.
         
         Args:
-            snake_body (list): List of snake body segment positions
+            snake_body_set (set): Set of cells occupied by the snake
         """
-        while True:
-            self.position = self.generate_position()
-            if self.position not in snake_body:
-                break
+        if len(snake_body_set) * 4 < len(ALL_CELLS):
+            # Mostly empty board: a random cell is free at least 3 times in 4,
+            # so retrying is cheaper than building the free-cell list
+            while True:
+                self.position = self.generate_position()
+                if self.position not in snake_body_set:
+                    break
+        else:
+            # Crowded board: pick directly from the free cells, no retries
+            self.position = random.choice(tuple(ALL_CELLS - snake_body_set))
         self.number = random.randint(1, 9)
 
 class Game:
@@ -136,47 +187,147 @@ class Game:
     
     def __init__(self):
         """Initialize the game window and game objects."""
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        # SCALED uses SDL2's renderer-backed texture path; vsync stays off so TICK_MS sets the pace
+        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT),
+                                              pygame.SCALED | pygame.DOUBLEBUF, vsync=0)
         pygame.display.set_caption("🐍 Reverse Snake - Retro Edition")
-        self.clock = pygame.time.Clock()
+        # Only QUIT and KEYDOWN are handled; drop everything else before it hits the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
         self.snake = Snake()
         self.food = Food()
         self.score = 0
         self.high_score = 0
+        self.turned = False  # Whether an arrow key was pressed during the current tick
         
         # Fonts for retro feel
         self.font_large = pygame.font.Font(None, 48)
         self.font_medium = pygame.font.Font(None, 36)
         self.font_small = pygame.font.Font(None, 24)
         
+        # Food numbers are always 1-9, so render each digit (text + shadow) once
+        self.digit_cache = {
+            n: (self.font_medium.render(str(n), True, WHITE).convert_alpha(),
+                self.font_medium.render(str(n), True, BLACK).convert_alpha())
+            for n in range(1, 10)
+        }
+        
+        # Static HUD elements: instructions and the two mode banners
+        self.instruction_surf = self.font_small.render(
+            "🎮 ARROWS: Move | 🍎 EAT: Switch Direction | ⚡ SPACE: Restart", True, WHITE).convert_alpha()
+        self.reverse_banner = self.render_banner("◄ REVERSE MODE ►", CYAN, BLUE)
+        self.forward_banner = self.render_banner("► FORWARD MODE ◄", GREEN, DARK_GREEN)
+        
+        # Score surfaces are cached and only re-rendered when the value changes
+        self._last_score = None
+        self._last_high_score = None
+        
+        # Dirty-rect rendering state: what was drawn last frame and where
+        self.full_redraw = True
+        self._drawn_cells = set()
+        self._drawn_food_area = None
+        self._drawn_hud = {}
+        
         # Game border
         self.border_thickness = 2
         
-    def handle_events(self):
-        for event in pygame.event.get():
+        # Pre-render the static grid and border once; draw() just blits it
+        self.background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        self.background.fill(BLACK)
+        for x in range(0, WINDOW_WIDTH, CELL_SIZE * 4):
+            pygame.draw.line(self.background, DARK_GRAY, (x, 0), (x, WINDOW_HEIGHT), 1)
+        for y in range(0, WINDOW_HEIGHT, CELL_SIZE * 4):
+            pygame.draw.line(self.background, DARK_GRAY, (0, y), (WINDOW_WIDTH, y), 1)
+        pygame.draw.rect(self.background, WHITE, (0, 0, WINDOW_WIDTH, WINDOW_HEIGHT), self.border_thickness)
+        
+        # Screen rect of every grid cell, built once. Includes a one-cell ring outside the
+        # grid because the head is drawn off-grid on the frame it hits a wall.
+        self.cell_rects = {
+            (x, y): pygame.Rect(x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+            for x in range(-1, GRID_WIDTH + 1)
+            for y in range(-1, GRID_HEIGHT + 1)
+        }
+        
+        # Pre-render body segments (fill + outline) so they can be batched with blits()
+        self.body_surfaces = {}
+        for color in (GREEN, DARK_GREEN):
+            segment = pygame.Surface((CELL_SIZE, CELL_SIZE)).convert()
+            segment.fill(color)
+            pygame.draw.rect(segment, WHITE, segment.get_rect(), 1)
+            self.body_surfaces[color] = segment
+        
+        # Pre-render the head for each mode (fill + outline + eyes)
+        self.head_surfaces = {}
+        for color in (GREEN, CYAN):
+            head = pygame.Surface((CELL_SIZE, CELL_SIZE)).convert()
+            head.fill(color)
+            pygame.draw.rect(head, WHITE, head.get_rect(), 2)
+            # Add eyes to the head for character
+            eye_size = 3
+            pygame.draw.circle(head, BLACK, (5, 5), eye_size)
+            pygame.draw.circle(head, BLACK, (CELL_SIZE - 8, 5), eye_size)
+            self.head_surfaces[color] = head
+        
+    def render_banner(self, text, color, bg_color):
+        """Pre-render a mode banner with its background and border.
+        
+        Args:
+            text (str): Banner label
+            color (tuple): Text and border color
+            bg_color (tuple): Background fill color
+        """
+        banner = pygame.Surface((170, 25)).convert()
+        banner.fill(bg_color)
+        pygame.draw.rect(banner, color, banner.get_rect(), 2)
+        banner.blit(self.font_small.render(text, True, color), (5, 5))
+        return banner
+    
+    def pulse_color(self, color, shift):
+        """Scale a color between 70% and 100% brightness on an integer triangle wave.
+        
+        Args:
+            color (tuple): Color at full brightness
+            shift (int): Tick shift setting the pulse speed (one pulse every 64 << shift ms)
+        """
+        p = abs(((pygame.time.get_ticks() >> shift) & 63) - 32)  # 0..32
+        scale = 179 + (p * 77 >> 5)  # 179..256, i.e. ~0.7..1.0 in 8-bit fixed point
+        return tuple(c * scale >> 8 for c in color)
+    
+    def handle_events(self, events):
+        """Handle input while playing; returns False when the game should quit.
+        
+        Args:
+            events (list): Events received since the last call
+        """
+        for event in events:
             if event.type == pygame.QUIT:
                 return False
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP:
-                    self.snake.change_direction((0, -1))
-                elif event.key == pygame.K_DOWN:
-                    self.snake.change_direction((0, 1))
-                elif event.key == pygame.K_LEFT:
-                    self.snake.change_direction((-1, 0))
-                elif event.key == pygame.K_RIGHT:
-                    self.snake.change_direction((1, 0))
+                if event.key in DIRECTION_KEYS:
+                    self.snake.change_direction(DIRECTION_KEYS[event.key])
+                    self.turned = True
                 elif event.key == pygame.K_ESCAPE:
                     return False
         return True
     
+    def steer_from_held_keys(self):
+        """Poll held arrow keys once per tick when no key was pressed during it."""
+        if not self.turned:
+            keys = pygame.key.get_pressed()
+            for key, direction in DIRECTION_KEYS.items():
+                if keys[key]:
+                    self.snake.change_direction(direction)
+                    break
+        self.turned = False
+    
     def update(self):
         self.snake.move()
         
         # Check if snake ate food (always check head since it's always the active end)
-        if self.snake.body[0] == self.food.position:
+        if self.snake.head == self.food.position:
             self.snake.eat_food(self.food.number)
             self.score += self.food.number
-            self.food.respawn(self.snake.body)
+            self.food.respawn(self.snake.body_set)
         
         # Check collision
         if self.snake.check_collision():
@@ -185,95 +336,111 @@ class Game:
         return True
     
     def draw(self):
-        # Fill background with dark pattern
-        self.screen.fill(BLACK)
-        
-        # Draw retro grid pattern
-        for x in range(0, WINDOW_WIDTH, CELL_SIZE * 4):
-            pygame.draw.line(self.screen, DARK_GRAY, (x, 0), (x, WINDOW_HEIGHT), 1)
-        for y in range(0, WINDOW_HEIGHT, CELL_SIZE * 4):
-            pygame.draw.line(self.screen, DARK_GRAY, (0, y), (WINDOW_WIDTH, y), 1)
-        
-        # Draw game border
-        pygame.draw.rect(self.screen, WHITE, (0, 0, WINDOW_WIDTH, WINDOW_HEIGHT), self.border_thickness)
-        
-        # Draw snake with retro style
-        for i, segment in enumerate(self.snake.body):
-            x, y = segment
-            rect = pygame.Rect(x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE)
-            if i == 0:  # Head
-                # Change head color when moving backwards
-                head_color = CYAN if self.snake.moving_backwards else GREEN
-                pygame.draw.rect(self.screen, head_color, rect)
-                pygame.draw.rect(self.screen, WHITE, rect, 2)
-                
-                # Add eyes to the head for character
-                eye_size = 3
-                eye1_pos = (x * CELL_SIZE + 5, y * CELL_SIZE + 5)
-                eye2_pos = (x * CELL_SIZE + CELL_SIZE - 8, y * CELL_SIZE + 5)
-                pygame.draw.circle(self.screen, BLACK, eye1_pos, eye_size)
-                pygame.draw.circle(self.screen, BLACK, eye2_pos, eye_size)
-            else:  # Body
-                # Gradient body effect
-                body_color = DARK_GREEN if i % 2 == 0 else GREEN
-                pygame.draw.rect(self.screen, body_color, rect)
-                pygame.draw.rect(self.screen, WHITE, rect, 1)
-        
-        # Draw food with retro glow effect
-        food_x, food_y = self.food.position
-        food_rect = pygame.Rect(food_x * CELL_SIZE, food_y * CELL_SIZE, CELL_SIZE, CELL_SIZE)
-        
-        # Pulsing food effect
-        import math
-        pulse = abs(math.sin(pygame.time.get_ticks() * 0.005)) * 0.3 + 0.7
-        food_color = (int(255 * pulse), int(100 * pulse), int(100 * pulse))
-        
-        pygame.draw.rect(self.screen, food_color, food_rect)
-        pygame.draw.rect(self.screen, YELLOW, food_rect, 2)
-        
-        # Draw number on food with better styling
-        number_text = self.font_medium.render(str(self.food.number), True, WHITE)
+        """Redraw the regions that changed since the last frame and push only those to the display."""
+        screen = self.screen
+        snake = self.snake
+        
+        # Snake: every cell covered last frame or this frame is repainted, since
+        # the body gradient shifts by one segment on each move
+        snake_cells = set(snake.body_set)
+        cell_rects = self.cell_rects
+        dirty_rects = [cell_rects[cell] for cell in snake_cells | self._drawn_cells]
+        self._drawn_cells = snake_cells
+        
+        # Food: the number glyph overhangs its cell, so track the full area drawn
+        food_rect = cell_rects[self.food.position]
+        number_text, shadow_text = self.digit_cache[self.food.number]
         text_rect = number_text.get_rect(center=food_rect.center)
         # Add text shadow
         shadow_rect = text_rect.copy()
         shadow_rect.x += 1
         shadow_rect.y += 1
-        shadow_text = self.font_medium.render(str(self.food.number), True, BLACK)
-        self.screen.blit(shadow_text, shadow_rect)
-        self.screen.blit(number_text, text_rect)
-        
-        # Draw retro-style HUD
-        # Score with glow effect
-        score_text = self.font_large.render(f"SCORE: {self.score:04d}", True, YELLOW)
-        score_shadow = self.font_large.render(f"SCORE: {self.score:04d}", True, BLACK)
-        self.screen.blit(score_shadow, (12, 12))
-        self.screen.blit(score_text, (10, 10))
+        food_area = food_rect.unionall([text_rect, shadow_rect])
+        dirty_rects.append(food_area)
+        if self._drawn_food_area is not None:
+            dirty_rects.append(self._drawn_food_area)
+        self._drawn_food_area = food_area
+        
+        # Retro-style HUD
+        # Score with glow effect, re-rendered only when the value changes
+        if self.score != self._last_score:
+            self._last_score = self.score
+            self._score_surf = self.font_large.render(f"SCORE: {self.score:04d}", True, YELLOW).convert_alpha()
+            self._score_shadow = self.font_large.render(f"SCORE: {self.score:04d}", True, BLACK).convert_alpha()
         
         # High score
         if self.score > self.high_score:
             self.high_score = self.score
-        high_score_text = self.font_small.render(f"HIGH: {self.high_score:04d}", True, WHITE)
-        self.screen.blit(high_score_text, (10, 60))
+        if self.high_score != self._last_high_score:
+            self._last_high_score = self.high_score
+            self._high_score_surf = self.font_small.render(f"HIGH: {self.high_score:04d}", True, WHITE).convert_alpha()
         
         # Show movement direction status with retro styling
-        if self.snake.moving_backwards:
-            status_text = self.font_small.render("◄ REVERSE MODE ►", True, CYAN)
-            mode_bg = pygame.Rect(WINDOW_WIDTH - 180, 10, 170, 25)
-            pygame.draw.rect(self.screen, BLUE, mode_bg)
-            pygame.draw.rect(self.screen, CYAN, mode_bg, 2)
-            self.screen.blit(status_text, (WINDOW_WIDTH - 175, 15))
+        mode_banner = self.reverse_banner if snake.moving_backwards else self.forward_banner
+        
+        hud = {
+            "score": [(self._score_shadow, (12, 12)), (self._score_surf, (10, 10))],
+            "high_score": [(self._high_score_surf, (10, 60))],
+            "mode": [(mode_banner, (WINDOW_WIDTH - 180, 10))],
+            "instructions": [(self.instruction_surf, (10, WINDOW_HEIGHT - 30))],
+        }
+        
+        # A HUD element is redrawn when its content changed or something beneath it was cleared.
+        # Text is alpha-blended, so it must never be blitted again over itself.
+        hud_blits = []
+        for name, pieces in hud.items():
+            area = pygame.Rect(pieces[0][1], pieces[0][0].get_size()).unionall(
+                [pygame.Rect(pos, surf.get_size()) for surf, pos in pieces[1:]])
+            previous = self._drawn_hud.get(name)
+            if previous is not None and previous[0] != pieces:
+                dirty_rects.append(previous[1])
+                dirty_rects.append(area)
+            elif self.full_redraw or area.collidelist(dirty_rects) != -1:
+                dirty_rects.append(area)
+            else:
+                continue
+            hud_blits.extend(pieces)
+            self._drawn_hud[name] = (pieces, area)
+        
+        # Clear changed regions from the pre-rendered grid pattern and game border
+        if self.full_redraw:
+            screen.blit(self.background, (0, 0))
         else:
-            status_text = self.font_small.render("► FORWARD MODE ◄", True, GREEN)
-            mode_bg = pygame.Rect(WINDOW_WIDTH - 180, 10, 170, 25)
-            pygame.draw.rect(self.screen, DARK_GREEN, mode_bg)
-            pygame.draw.rect(self.screen, GREEN, mode_bg, 2)
-            self.screen.blit(status_text, (WINDOW_WIDTH - 175, 15))
+            screen.blits([(self.background, rect, rect) for rect in dirty_rects], False)
+        
+        # Draw snake with retro style, head and body batched into a single blits() call
+        segments = snake.segments()
+        # Change head color when moving backwards
+        head_color = CYAN if snake.moving_backwards else GREEN
+        dark_segment = self.body_surfaces[DARK_GREEN]
+        light_segment = self.body_surfaces[GREEN]
+        snake_blits = [(self.head_surfaces[head_color], cell_rects[segments[0]])]
+        snake_blits.extend(
+            # Gradient body effect
+            (dark_segment if i % 2 == 0 else light_segment, cell_rects[segment])
+            for i, segment in enumerate(segments[1:], 1)
+        )
+        screen.blits(snake_blits, False)
         
-        # Draw retro instructions
-        instruction_text = self.font_small.render("🎮 ARROWS: Move | 🍎 EAT: Switch Direction | ⚡ SPACE: Restart", True, WHITE)
-        self.screen.blit(instruction_text, (10, WINDOW_HEIGHT - 30))
+        # Draw food with retro glow effect
+        # Pulsing food effect
+        food_color = self.pulse_color((255, 100, 100), 3)
         
-        pygame.display.flip()
+        pygame.draw.rect(screen, food_color, food_rect)
+        pygame.draw.rect(screen, YELLOW, food_rect, 2)
+        
+        # Draw number on food with better styling
+        screen.blit(shadow_text, shadow_rect)
+        screen.blit(number_text, text_rect)
+        
+        # Draw HUD on top
+        screen.blits(hud_blits, False)
+        
+        if self.full_redraw:
+            self.full_redraw = False
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
     
     def game_over_screen(self):
         # Retro game over screen with effects
@@ -283,9 +450,7 @@ class Game:
         self.screen.blit(overlay, (0, 0))
         
         # Animated "GAME OVER" text
-        import math
-        pulse = abs(math.sin(pygame.time.get_ticks() * 0.01)) * 0.3 + 0.7
-        game_over_color = (int(255 * pulse), int(50 * pulse), int(50 * pulse))
+        game_over_color = self.pulse_color((255, 50, 50), 2)
         
         game_over_font = pygame.font.Font(None, 84)
         game_over_text = game_over_font.render("GAME OVER", True, game_over_color)
@@ -324,16 +489,23 @@ class Game:
     def run(self):
         running = True
         game_active = True
+        next_tick = pygame.time.get_ticks()
         
         while running:
+            # Sleep in SDL until input arrives or the next tick is due, and handle input on wake
+            events = []
+            timeout = next_tick - pygame.time.get_ticks()
+            if timeout > 0:
+                event = pygame.event.wait(timeout)
+                if event.type != pygame.NOEVENT:
+                    events.append(event)
+            events.extend(pygame.event.get())
+            
             if game_active:
-                running = self.handle_events()
-                if running:
-                    game_active = self.update()
-                    self.draw()
+                running = self.handle_events(events)
             else:
                 # Game over state
-                for event in pygame.event.get():
+                for event in events:
                     if event.type == pygame.QUIT:
                         running = False
                     elif event.type == pygame.KEYDOWN:
@@ -342,13 +514,23 @@ class Game:
                             self.snake = Snake()
                             self.food = Food()
                             self.score = 0
+                            self.turned = False
+                            self.full_redraw = True  # Repaint over the game over overlay
                             game_active = True
                         elif event.key == pygame.K_ESCAPE:
                             running = False
-                
-                self.game_over_screen()
             
-            self.clock.tick(10)  # 10 FPS for classic snake feel
+            if not running or pygame.time.get_ticks() < next_tick:
+                continue
+            
+            # Advance the game once per tick; skip ahead rather than burst if we fell behind
+            next_tick = max(next_tick + TICK_MS, pygame.time.get_ticks())
+            if game_active:
+                self.steer_from_held_keys()
+                game_active = self.update()
+                self.draw()
+            else:
+                self.game_over_screen()
         
         pygame.quit()
         sys.exit()